@@ -1,21 +1,49 @@
 import pygame
+import numpy as np
 import math
 import os
 import map_data
 import random
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from numba import njit, config as numba_config
+    JIT_ENABLED = not numba_config.DISABLE_JIT
+except ImportError:
+    # Numba is optional; without it the movement code runs as plain Python
+    JIT_ENABLED = False
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:
+    # Builds without the SDL2 video bindings only have the software renderer
+    Renderer = None
 
 # --- CONFIGURATION ---
 SCREEN_WIDTH = 640
 SCREEN_HEIGHT = 480
 TILE_SIZE = 32
+TILE_SIZE_SHIFT = TILE_SIZE.bit_length() - 1 # TILE_SIZE is a power of two, so x // TILE_SIZE == x >> TILE_SIZE_SHIFT
 FPS = 60
 WHITE = (255, 255, 255)
 RED = (255, 0, 0)
 BACKGROUND_COLOR = (0, 0, 0) # Back to dark to contrast sprites
+USE_HARDWARE_RENDERER = True # Draw with the GPU when pygame._sdl2 is available, else software blits
 
 # MOVEMENT CONFIGURATION
 WALK_SPEED = 2.0
 SPRINT_SPEED = 4.0
+DIAGONAL_FACTOR = 1.0 / math.sqrt(2) # Input is 8-directional, so diagonals always scale by this
+
+# Facing direction for each (x_axis, y_axis) input; vertical input wins on diagonals
+DIRECTION_LOOKUP = {
+    (0, -1): 'up',   (-1, -1): 'up',   (1, -1): 'up',
+    (0, 1):  'down', (-1, 1):  'down', (1, 1):  'down',
+    (-1, 0): 'left',
+    (1, 0):  'right',
+}
 
 # CAMERA CONFIGURATION
 CAMERA_X = SCREEN_WIDTH // 2
@@ -33,114 +61,302 @@ TILE_ASSETS = {
     map_data.SPAWN: 'spawn.png',
 }
 
-# --- ASSET LOADING HELPER ---
-def load_sprite(filename):
-    """Loads, scales, and converts a sprite image."""
-    path = os.path.join(ASSET_FOLDER, filename)
+# --- ASSET LOADING HELPERS ---
+_sprite_cache = {} # filename -> prepared sprite, shared by every caller
+
+def _read_image(filename):
+    """Reads an image file from disk. Safe to call from worker threads.
+
+    Returns (image, None) on success or (None, error) on failure, leaving the
+    reporting to the main thread so messages from different files don't interleave.
+    """
     try:
-        image = pygame.image.load(path).convert_alpha()
-        image = pygame.transform.scale(image, (TILE_SIZE, TILE_SIZE))
-        return image
-    except pygame.error as e:
-        print(f"Error loading image at path: {path}")
-        print(f"Pygame error: {e}")
+        return pygame.image.load(os.path.join(ASSET_FOLDER, filename)), None
+    except (pygame.error, OSError) as e:
+        return None, e
+
+def _prepare_sprite(image):
+    """Scales and converts a loaded image. Must run on the main thread."""
+    if image is None:
         missing_sprite = pygame.Surface([TILE_SIZE, TILE_SIZE])
         missing_sprite.fill(RED)
         return missing_sprite
 
+    if pygame.display.get_surface() is None:
+        # No display surface (hardware renderer): sprites are uploaded as textures unconverted
+        return pygame.transform.scale(image, (TILE_SIZE, TILE_SIZE))
+
+    if image.get_flags() & pygame.SRCALPHA and pygame.surfarray.array_alpha(image).min() < 255:
+        image = image.convert_alpha()
+    else:
+        # Fully opaque sprites (most tiles) skip per-pixel alpha blending when blitted
+        image = image.convert()
+    return pygame.transform.scale(image, (TILE_SIZE, TILE_SIZE))
+
+def load_sprites(filenames):
+    """Loads, scales, and converts several sprite images, reading the files in parallel.
+
+    Results are cached per filename, so the returned Surfaces are shared:
+    treat them as read-only blit sources and copy one before drawing on it.
+    """
+    pending = [filename for filename in dict.fromkeys(filenames) if filename not in _sprite_cache]
+    if len(pending) > 1:
+        # Disk reads and decoding release the GIL; SDL conversion stays on this thread
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(_read_image, pending))
+    else:
+        # A single file isn't worth starting a thread pool for
+        results = [_read_image(filename) for filename in pending]
+
+    for filename, (image, error) in zip(pending, results):
+        if error is not None:
+            print(f"Error loading image at path: {os.path.join(ASSET_FOLDER, filename)}")
+            print(f"Pygame error: {error}")
+        _sprite_cache[filename] = _prepare_sprite(image)
+    return [_sprite_cache[filename] for filename in filenames]
+
 # --- NEW: INPUT MANAGER CLASS ---
 class InputManager:
     """Handles keyboard input and translates it into generic game actions."""
+    # Maps Pygame keys to generic game actions
+    KEY_MAP = {
+        pygame.K_UP:    'up',
+        pygame.K_w:     'up',
+        pygame.K_DOWN:  'down',
+        pygame.K_s:     'down',
+        pygame.K_LEFT:  'left',
+        pygame.K_a:     'left',
+        pygame.K_RIGHT: 'right',
+        pygame.K_d:     'right',
+        pygame.K_LSHIFT:'sprint',
+        pygame.K_RSHIFT:'sprint',
+        pygame.K_SPACE: 'action_a', # A Button
+        pygame.K_y:     'action_y'  # Y Button
+    }
+    # Actions the game reads every frame; update() writes these directly
+    CORE_ACTIONS = ('up', 'down', 'left', 'right', 'sprint', 'action_a', 'action_y')
+    # Each action's current state is a plain boolean attribute, e.g. input_manager.up
+    __slots__ = tuple(dict.fromkeys(CORE_ACTIONS + tuple(KEY_MAP.values()))) + (
+        'key_map', '_core_keys', '_action_keys')
+
     def __init__(self):
-        # Maps Pygame keys to generic game actions
-        self.key_map = {
-            pygame.K_UP:    'up',
-            pygame.K_w:     'up',
-            pygame.K_DOWN:  'down',
-            pygame.K_s:     'down',
-            pygame.K_LEFT:  'left',
-            pygame.K_a:     'left',
-            pygame.K_RIGHT: 'right',
-            pygame.K_d:     'right',
-            pygame.K_LSHIFT:'sprint',
-            pygame.K_RSHIFT:'sprint',
-            pygame.K_SPACE: 'action_a', # A Button
-            pygame.K_y:     'action_y'  # Y Button
-        }
-        # This dictionary will hold the current state of all actions
-        self.action_state = {
-            'up': False, 'down': False, 'left': False, 'right': False,
-            'sprint': False, 'action_a': False, 'action_y': False
-        }
+        self.key_map = self.KEY_MAP
+        grouped_keys = {}
+        for key, action in self.key_map.items():
+            grouped_keys.setdefault(action, []).append(key)
+
+        # Two keys per core action, flattened in CORE_ACTIONS order. A single key is repeated
+        # and an unbound action reads K_UNKNOWN, which is never pressed
+        self._core_keys = tuple(
+            key
+            for action in self.CORE_ACTIONS
+            for keys in [grouped_keys.get(action, [pygame.K_UNKNOWN])]
+            for key in (keys[0], keys[-1])
+        )
+        # Any other actions, and core actions bound to more than two keys
+        self._action_keys = tuple(
+            (action, tuple(keys)) for action, keys in grouped_keys.items()
+            if action not in self.CORE_ACTIONS or len(keys) > 2
+        )
+
+        for action in dict.fromkeys(self.CORE_ACTIONS + tuple(grouped_keys)):
+            setattr(self, action, False)
 
     def update(self):
-        """Reads the keyboard state and updates the action_state dictionary."""
+        """Reads the keyboard state and updates the action attributes."""
         keys = pygame.key.get_pressed()
-        
-        # Reset and then update the state based on currently pressed keys
-        for action in self.action_state:
-            self.action_state[action] = False
-            
-        for key, action in self.key_map.items():
-            if keys[key]:
-                self.action_state[action] = True
 
-    def is_pressed(self, action):
-        """Checks if a specific game action is currently active."""
-        return self.action_state.get(action, False)
+        # An action is active if any of its keys is held
+        (up0, up1, down0, down1, left0, left1, right0, right1,
+         sprint0, sprint1, action_a0, action_a1, action_y0, action_y1) = self._core_keys
+        self.up = keys[up0] or keys[up1]
+        self.down = keys[down0] or keys[down1]
+        self.left = keys[left0] or keys[left1]
+        self.right = keys[right0] or keys[right1]
+        self.sprint = keys[sprint0] or keys[sprint1]
+        self.action_a = keys[action_a0] or keys[action_a1]
+        self.action_y = keys[action_y0] or keys[action_y1]
+
+        for action, action_keys in self._action_keys:
+            setattr(self, action, any(map(keys.__getitem__, action_keys)))
 
 # --- MAP SYSTEM CLASS ---
 class Map():
-    def __init__(self, map_name):
+    def __init__(self, map_name, renderer=None):
         self.map_array = map_data.MAP_COLLECTION[map_name]
+        self.map_np = np.array(self.map_array, dtype=np.uint8)
+        self.wall_mask = np.ascontiguousarray(self.map_np == map_data.WALL, dtype=np.bool_)
         self.height = len(self.map_array)
         self.width = len(self.map_array[0])
+        self.wall_dist = self.compute_wall_distance()
+        # Grids handed to the movement code: arrays for Numba, nested lists for plain
+        # Python, where list indexing beats NumPy scalar indexing
+        if JIT_ENABLED:
+            self.collision_mask, self.collision_dist = self.wall_mask, self.wall_dist
+        else:
+            self.collision_mask, self.collision_dist = self.wall_mask.tolist(), self.wall_dist.tolist()
+        # Pixel position of every column and row, relative to the map's top-left
+        self._base_xs = np.arange(self.width) * TILE_SIZE
+        self._base_ys = np.arange(self.height) * TILE_SIZE
+        self.cols_visible = SCREEN_WIDTH // TILE_SIZE + 1
+        self.rows_visible = SCREEN_HEIGHT // TILE_SIZE + 1
         self.tile_sprites = self.load_map_tiles()
 
+        if renderer is not None:
+            # The GPU draws the visible tiles every frame, so no background surface is needed
+            self.tile_textures = [
+                Texture.from_surface(renderer, sprite) if sprite is not None else None
+                for sprite in self.tile_sprites
+            ]
+            self.background = None
+        else:
+            self.tile_textures = None
+            self.background = self.render_background()
+
+    def compute_wall_distance(self):
+        """Builds the chessboard distance (in tiles) from every tile to the nearest WALL tile."""
+        # Grow the wall region one ring of tiles at a time; a map without walls stays "far"
+        dist = np.full((self.height, self.width), self.height + self.width, dtype=np.int32)
+        reached = self.wall_mask.copy()
+        dist[reached] = 0
+
+        step = 0
+        while reached.any() and not reached.all():
+            step += 1
+            padded = np.pad(reached, 1)
+            grown = np.zeros_like(reached)
+            for dy in range(3):
+                for dx in range(3):
+                    grown |= padded[dy:dy + self.height, dx:dx + self.width]
+            dist[grown & ~reached] = step
+            reached = grown
+        return dist
+
     def load_map_tiles(self):
-        """Pre-loads and scales all tile sprites required for the map."""
-        sprites = {}
-        for code, filename in TILE_ASSETS.items():
-            sprites[code] = load_sprite(filename)
+        """Pre-loads and scales all tile sprites required for the map.
+
+        Returns a list indexed by tile code, with None for codes that have no sprite.
+        """
+        sprites = [None] * (max(TILE_ASSETS) + 1)
+        for code, sprite in zip(TILE_ASSETS, load_sprites(list(TILE_ASSETS.values()))):
+            sprites[code] = sprite
         return sprites
 
+    def render_background(self):
+        """Pre-renders the whole static map into a single surface, once at load time."""
+        background = pygame.Surface((self.width * TILE_SIZE, self.height * TILE_SIZE)).convert()
+        background.fill(BACKGROUND_COLOR)
+
+        # Flatten the map into (image, position) pairs and hand them to SDL in one batch.
+        # Tiles without a sprite are dropped up front so fblits never sees a None surface,
+        # and every position lies inside the background, so SDL never has to clip one away.
+        tile_sprites = self.tile_sprites
+        has_sprite = np.array([sprite is not None for sprite in tile_sprites])
+        drawn = has_sprite[self.map_np.ravel()]
+        codes = self.map_np.ravel()[drawn].tolist()
+        xs = np.tile(self._base_xs, self.height)[drawn].tolist()
+        ys = np.repeat(self._base_ys, self.width)[drawn].tolist()
+        blit_sequence = [(tile_sprites[tile_code], (x, y)) for tile_code, x, y in zip(codes, xs, ys)]
+
+        # fblits is pygame-ce only; plain pygame falls back to blits
+        if hasattr(background, 'fblits'):
+            background.fblits(blit_sequence, 0)
+        else:
+            background.blits(blit_sequence, doreturn=False)
+        return background
+
     def draw(self, screen, camera_offset_x, camera_offset_y):
-        """Renders only the visible tiles to the screen, offset by the camera."""
-        cols_visible = SCREEN_WIDTH // TILE_SIZE + 1
-        rows_visible = SCREEN_HEIGHT // TILE_SIZE + 1
-        
-        start_row = max(0, math.floor(-camera_offset_y / TILE_SIZE))
-        start_col = max(0, math.floor(-camera_offset_x / TILE_SIZE))
+        """Renders the pre-rendered map to the screen, offset by the camera."""
+        screen.blit(self.background, (camera_offset_x, camera_offset_y))
 
-        end_row = min(self.height, start_row + rows_visible)
-        end_col = min(self.width, start_col + cols_visible)
-        
-        for row_index in range(start_row, end_row):
-            for col_index in range(start_col, end_col):
-                tile_code = self.map_array[row_index][col_index]
-                x = col_index * TILE_SIZE + camera_offset_x
-                y = row_index * TILE_SIZE + camera_offset_y
-                
-                tile_image = self.tile_sprites.get(tile_code)
-                if tile_image:
-                    screen.blit(tile_image, (x, y))
+    def draw_area(self, screen, camera_offset_x, camera_offset_y, screen_rect):
+        """Re-renders only the part of the map under screen_rect (in screen pixels)."""
+        screen.fill(BACKGROUND_COLOR, screen_rect)
+        map_rect = screen_rect.move(-camera_offset_x, -camera_offset_y)
+        screen.blit(self.background, screen_rect, map_rect)
+
+    def draw_hardware(self, renderer, camera_offset_x, camera_offset_y):
+        """Renders only the visible tiles with the GPU renderer, offset by the camera."""
+        start_row = max(0, -camera_offset_y >> TILE_SIZE_SHIFT)
+        start_col = max(0, -camera_offset_x >> TILE_SIZE_SHIFT)
+
+        end_row = min(self.height, start_row + self.rows_visible)
+        end_col = min(self.width, start_col + self.cols_visible)
+
+        xs = (self._base_xs[start_col:end_col] + camera_offset_x).tolist()
+        ys = (self._base_ys[start_row:end_row] + camera_offset_y).tolist()
+        tile_textures = self.tile_textures
+
+        for row_codes, y in zip(self.map_np[start_row:end_row, start_col:end_col].tolist(), ys):
+            for tile_code, x in zip(row_codes, xs):
+                texture = tile_textures[tile_code]
+                if texture is not None:
+                    renderer.blit(texture, pygame.Rect(x, y, TILE_SIZE, TILE_SIZE))
 
 # --- PLAYER SPAWN UTILITY ---
 def get_random_spawn_point(map_instance):
     """Scans the map array for all SPAWN tiles and returns a random (x, y) pixel coordinate."""
-    spawn_points = []
-    for row_index, row in enumerate(map_instance.map_array):
-        for col_index, tile_code in enumerate(row):
-            if tile_code == map_data.SPAWN:
-                x = col_index * TILE_SIZE
-                y = row_index * TILE_SIZE
-                spawn_points.append((x, y))
-
-    if not spawn_points:
+    ys, xs = np.where(map_instance.map_np == map_data.SPAWN)
+
+    if not len(xs):
         print("Warning: No SPAWN tiles found. Starting at (0, 0) in world coordinates.")
         return (0, 0)
-        
-    return random.choice(spawn_points)
+
+    i = random.randrange(len(xs))
+    return (int(xs[i]) * TILE_SIZE, int(ys[i]) * TILE_SIZE)
+
+# --- MOVEMENT & COLLISION (JIT-COMPILED) ---
+@njit(cache=True, fastmath=True)
+def _check_collision(next_x, next_y, width, height, wall_mask, wall_dist, tile_size):
+    """Checks if a box at a position (in pixels) collides with a WALL tile.
+
+    wall_mask and wall_dist are indexed [row][col], so they may be NumPy arrays or nested lists.
+    """
+    map_height = len(wall_mask)
+    map_width = len(wall_mask[0])
+    tile_x1 = int(next_x // tile_size)
+    tile_y1 = int(next_y // tile_size)
+
+    # Fast path: the box only reaches this many tiles past its top-left tile,
+    # so if the nearest wall is further away than that it cannot collide
+    reach = (max(width, height) - 1) // tile_size + 1
+    if 0 <= tile_y1 < map_height and 0 <= tile_x1 < map_width and wall_dist[tile_y1][tile_x1] > reach:
+        return False
+
+    tile_x2 = int((next_x + width - 1) // tile_size)
+    tile_y2 = int((next_y + height - 1) // tile_size)
+
+    # Corners outside the map never collide
+    return ((0 <= tile_y1 < map_height and 0 <= tile_x1 < map_width and wall_mask[tile_y1][tile_x1])
+            or (0 <= tile_y1 < map_height and 0 <= tile_x2 < map_width and wall_mask[tile_y1][tile_x2])
+            or (0 <= tile_y2 < map_height and 0 <= tile_x1 < map_width and wall_mask[tile_y2][tile_x1])
+            or (0 <= tile_y2 < map_height and 0 <= tile_x2 < map_width and wall_mask[tile_y2][tile_x2]))
+
+@njit(cache=True, fastmath=True)
+def _move_and_collide(world_x, world_y, change_x, change_y, speed, width, height, wall_mask, wall_dist, tile_size):
+    """Moves a box by (change_x, change_y) with diagonal correction, collision and map clamping.
+
+    Returns the new (world_x, world_y).
+    """
+    if change_x != 0 or change_y != 0:
+        dx = change_x
+        dy = change_y
+        if change_x != 0 and change_y != 0:
+            dx = math.copysign(speed * DIAGONAL_FACTOR, change_x)
+            dy = math.copysign(speed * DIAGONAL_FACTOR, change_y)
+
+        if not _check_collision(world_x + dx, world_y, width, height, wall_mask, wall_dist, tile_size):
+            world_x += dx
+
+        if not _check_collision(world_x, world_y + dy, width, height, wall_mask, wall_dist, tile_size):
+            world_y += dy
+
+    map_max_x = float(len(wall_mask[0]) * tile_size - width)
+    map_max_y = float(len(wall_mask) * tile_size - height)
+
+    world_x = max(0.0, min(world_x, map_max_x))
+    world_y = max(0.0, min(world_y, map_max_y))
+    return world_x, world_y
 
 # --- PLAYER CLASS ---
 class Player(pygame.sprite.Sprite):
@@ -157,11 +373,12 @@ class Player(pygame.sprite.Sprite):
         self.sprint_speed = SPRINT_SPEED
         self.current_speed = self.walk_speed
 
+        up, down, left, right = load_sprites(['arrowUp.png', 'arrowDown.png', 'arrowLeft.png', 'arrowRight.png'])
         self.sprites = {
-            'up': load_sprite('arrowUp.png'),
-            'down': load_sprite('arrowDown.png'),
-            'left': load_sprite('arrowLeft.png'),
-            'right': load_sprite('arrowRight.png'),
+            'up': up,
+            'down': down,
+            'left': left,
+            'right': right,
         }
         
         self.current_direction = 'down'
@@ -171,102 +388,112 @@ class Player(pygame.sprite.Sprite):
         self.change_x = 0
         self.change_y = 0
 
-    def _check_collision(self, next_x, next_y):
-        """Checks if a position (in pixels) collides with a WALL tile."""
-        tile_x1 = int(next_x // TILE_SIZE)
-        tile_y1 = int(next_y // TILE_SIZE)
-        tile_x2 = int((next_x + self.rect.width - 1) // TILE_SIZE)
-        tile_y2 = int((next_y + self.rect.height - 1) // TILE_SIZE)
-
-        map_array = self.current_map.map_array
-        
-        for tx, ty in [(tile_x1, tile_y1), (tile_x1, tile_y2), (tile_x2, tile_y1), (tile_x2, tile_y2)]:
-            if 0 <= ty < self.current_map.height and 0 <= tx < self.current_map.width:
-                tile_code = map_array[ty][tx]
-                if tile_code == map_data.WALL:
-                    return True
-        return False
-
     def handle_input(self, input_manager):
         """Reads from the InputManager to set speed and movement vectors."""
-        if input_manager.is_pressed('sprint'):
-            self.current_speed = self.sprint_speed
-        else:
-            self.current_speed = self.walk_speed
-            
-        self.change_x = 0
-        self.change_y = 0
+        self.current_speed = self.sprint_speed if input_manager.sprint else self.walk_speed
+
+        # Each axis is -1, 0 or 1; opposite keys cancel out
+        x_axis = input_manager.right - input_manager.left
+        y_axis = input_manager.down - input_manager.up
+        self.change_x = x_axis * self.current_speed
+        self.change_y = y_axis * self.current_speed
+        self.current_direction = DIRECTION_LOOKUP.get((x_axis, y_axis), self.current_direction)
 
-        if input_manager.is_pressed('left'):
-            self.change_x = -self.current_speed
-            self.current_direction = 'left'
-        if input_manager.is_pressed('right'):
-            self.change_x = self.current_speed
-            self.current_direction = 'right'
-        if input_manager.is_pressed('up'):
-            self.change_y = -self.current_speed
-            self.current_direction = 'up'
-        if input_manager.is_pressed('down'):
-            self.change_y = self.current_speed
-            self.current_direction = 'down'
-            
         self.image = self.sprites[self.current_direction]
         
-        if input_manager.is_pressed('action_a'):
+        if input_manager.action_a:
             print("Action Button (A) Pressed!")
-        if input_manager.is_pressed('action_y'):
+        if input_manager.action_y:
             print("Use Button (Y) Pressed!")
 
     def update(self):
         """Calculates position changes, applies diagonal correction and collision."""
-        mag_sq = self.change_x**2 + self.change_y**2
-        dx, dy = 0, 0
-        
-        if mag_sq > 0:
-            if self.change_x != 0 and self.change_y != 0:
-                scaling_factor = self.current_speed / math.sqrt(mag_sq)
-                dx = self.change_x * scaling_factor
-                dy = self.change_y * scaling_factor
-            else:
-                dx = self.change_x
-                dy = self.change_y
-
-            if not self._check_collision(self.world_x + dx, self.world_y):
-                self.world_x += dx
-            
-            if not self._check_collision(self.world_x, self.world_y + dy):
-                self.world_y += dy
-
-        map_max_x = self.current_map.width * TILE_SIZE - self.rect.width
-        map_max_y = self.current_map.height * TILE_SIZE - self.rect.height
-        
-        self.world_x = max(0, min(self.world_x, map_max_x))
-        self.world_y = max(0, min(self.world_y, map_max_y))
+        if not (self.change_x or self.change_y):
+            return # Standing still: the position is already inside the map
+
+        self.world_x, self.world_y = _move_and_collide(
+            float(self.world_x), float(self.world_y),
+            float(self.change_x), float(self.change_y), float(self.current_speed),
+            self.rect.width, self.rect.height,
+            self.current_map.collision_mask, self.current_map.collision_dist, TILE_SIZE)
+
+# --- RENDERER SETUP ---
+def create_renderer(caption):
+    """Opens the game window with a GPU renderer, or returns None if that isn't possible."""
+    if not USE_HARDWARE_RENDERER or Renderer is None:
+        return None
+
+    window = None
+    try:
+        window = Window(caption, size=(SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Require a GPU driver; SDL would otherwise fall back to its software renderer,
+        # which is slower than the pre-rendered background blit
+        return Renderer(window, accelerated=1)
+    except RuntimeError as e: # Both pygame.error and pygame._sdl2's own error derive from this
+        print(f"Hardware renderer unavailable, using software rendering: {e}")
+        if window is not None:
+            window.destroy()
+        return None
 
 # --- MAIN GAME LOOP ---
 def main():
     pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    pygame.display.set_caption("Top-Down Game Prototype")
+    caption = "Top-Down Game Prototype"
+    renderer = create_renderer(caption)
+    if renderer is None:
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption(caption)
     clock = pygame.time.Clock()
 
     # --- SETUP GAME OBJECTS ---
     input_manager = InputManager() # Create the input handler
-    current_map = Map("map1")
+    current_map = Map("map1", renderer)
     start_x, start_y = get_random_spawn_point(current_map)
     player = Player(start_x, start_y, current_map)
-    
-    all_sprites = pygame.sprite.Group(player)
+
+    if renderer is not None:
+        renderer.draw_color = BACKGROUND_COLOR
+        player_textures = {
+            direction: Texture.from_surface(renderer, sprite)
+            for direction, sprite in player.sprites.items()
+        }
+
+    # Compile the movement code now so the JIT pause happens before the first frame
+    _move_and_collide(0.0, 0.0, 0.0, 0.0, 0.0, player.rect.width, player.rect.height,
+                      current_map.collision_mask, current_map.collision_dist, TILE_SIZE)
 
     map_width_pixels = current_map.width * TILE_SIZE
     map_height_pixels = current_map.height * TILE_SIZE
 
+    # Map and screen sizes never change, so each axis' camera clamp is picked once:
+    # maps smaller than the screen are centered, larger ones keep the view inside the map
+    if map_width_pixels < SCREEN_WIDTH:
+        centered_x = (SCREEN_WIDTH - map_width_pixels) // 2
+        clamp_camera_x = lambda offset_x: centered_x
+    else:
+        min_offset_x = SCREEN_WIDTH - map_width_pixels
+        clamp_camera_x = lambda offset_x: min(0, max(offset_x, min_offset_x))
+
+    if map_height_pixels < SCREEN_HEIGHT:
+        centered_y = (SCREEN_HEIGHT - map_height_pixels) // 2
+        clamp_camera_y = lambda offset_y: centered_y
+    else:
+        min_offset_y = SCREEN_HEIGHT - map_height_pixels
+        clamp_camera_y = lambda offset_y: min(0, max(offset_y, min_offset_y))
+
+    # State from the last drawn frame, used to only push what changed to the display
+    prev_camera = None # Forces a full redraw on the first frame
+    prev_player_rect = player.rect.copy()
+    prev_player_image = player.image
+
     # --- GAME LOOP ---
     running = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                prev_camera = None # The window needs repainting even if nothing moved
 
         # --- UPDATE ---
         input_manager.update() # Read keyboard state
@@ -274,29 +501,37 @@ def main():
         player.update() # Update player logic
 
         # --- CAMERA ---
-        camera_offset_x = CAMERA_X - player.world_x
-        camera_offset_y = CAMERA_Y - player.world_y
-        
-        # Clamp Camera X
-        if map_width_pixels < SCREEN_WIDTH:
-            camera_offset_x = (SCREEN_WIDTH - map_width_pixels) // 2
-        else:
-            camera_offset_x = min(0, max(camera_offset_x, SCREEN_WIDTH - map_width_pixels))
-
-        # Clamp Camera Y
-        if map_height_pixels < SCREEN_HEIGHT:
-            camera_offset_y = (SCREEN_HEIGHT - map_height_pixels) // 2
-        else:
-            camera_offset_y = min(0, max(camera_offset_y, SCREEN_HEIGHT - map_height_pixels))
+        # Whole pixels, so every draw path places the map the same way without re-casting
+        camera_offset_x = int(clamp_camera_x(CAMERA_X - player.world_x))
+        camera_offset_y = int(clamp_camera_y(CAMERA_Y - player.world_y))
 
         player.rect.topleft = (player.world_x + camera_offset_x, player.world_y + camera_offset_y)
 
         # --- DRAWING ---
-        screen.fill(BACKGROUND_COLOR)
-        current_map.draw(screen, camera_offset_x, camera_offset_y)
-        all_sprites.draw(screen)
-
-        pygame.display.flip()
+        camera = (camera_offset_x, camera_offset_y)
+        if renderer is not None:
+            # The GPU redraws the whole frame; dirty-rect tracking only helps software blits
+            renderer.clear()
+            current_map.draw_hardware(renderer, camera_offset_x, camera_offset_y)
+            renderer.blit(player_textures[player.current_direction], player.rect)
+            renderer.present()
+        elif camera != prev_camera:
+            # The view scrolled, so every pixel on screen changed
+            screen.fill(BACKGROUND_COLOR)
+            current_map.draw(screen, camera_offset_x, camera_offset_y)
+            screen.blit(player.image, player.rect) # A lone sprite needs no Group
+            pygame.display.flip()
+        elif player.rect != prev_player_rect or player.image is not prev_player_image:
+            # Only the player changed: repaint its old and new spots
+            dirty_rects = [prev_player_rect, player.rect.copy()]
+            for rect in dirty_rects:
+                current_map.draw_area(screen, camera_offset_x, camera_offset_y, rect)
+            screen.blit(player.image, player.rect)
+            pygame.display.update(dirty_rects)
+
+        prev_camera = camera
+        prev_player_rect = player.rect.copy()
+        prev_player_image = player.image
         clock.tick(FPS)
 
     pygame.quit()